@@ -0,0 +1 @@
+"""Pulumi infrastructure code for deploying RCTab on Azure."""
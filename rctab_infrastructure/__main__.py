@@ -3,8 +3,13 @@
 from pulumi_tls import PrivateKey, PrivateKeyArgs
 
 from rctab_infrastructure.api import set_up_api
+from rctab_infrastructure.constants import DB_ROOT_CERT_PATH
 from rctab_infrastructure.function_apps import set_up_function_apps
 from rctab_infrastructure.rctab_logging import create_action_group, set_up_logging
+from rctab_infrastructure.utils import assert_is_file
+
+# Fail before any resources are registered if the certificate is missing
+assert_is_file(DB_ROOT_CERT_PATH)
 
 # Create central logging and workspace
 workspace_id, logging_connection_string, logging_resouce_group = set_up_logging()
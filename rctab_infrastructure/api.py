@@ -14,7 +14,7 @@ from pulumi_azure_native.insights import (
 from pulumi_azure_native.insights.v20200202 import Component, ComponentArgs
 from pulumi_tls import PrivateKey
 
-from rctab_infrastructure.constants import DATABASE_NAME, IDENTIFIER, PRIMARY_IP
+from rctab_infrastructure.constants import DATABASE_NAME, PRIMARY_IP, get_identifier
 from rctab_infrastructure.database import create_database_server, create_database_user
 from rctab_infrastructure.keyvault import create_vault
 from rctab_infrastructure.webapp import create_webapp
@@ -95,14 +95,14 @@ def set_up_api(
         A tuple containing the app plan id and the url of the webapp.
     """
     api_resource_group = resources.ResourceGroup(
-        f"rctab-{IDENTIFIER}-",
+        f"rctab-{get_identifier()}-",
         resources.ResourceGroupArgs(location="UK South"),
     )
 
     # Dedicated plan (not based on usage)
     app_plan = web.AppServicePlan(
         # Dedicated plan (not based on usage)
-        f"rctab-app-plan-{IDENTIFIER}-",
+        f"rctab-app-plan-{get_identifier()}-",
         web.AppServicePlanArgs(
             location=api_resource_group.location,
             resource_group_name=api_resource_group.name,
@@ -113,7 +113,7 @@ def set_up_api(
     )
 
     app_insights = Component(
-        f"rctab-{IDENTIFIER}-",
+        f"rctab-{get_identifier()}-",
         ComponentArgs(
             resource_group_name=api_resource_group.name,
             location=api_resource_group.location,
@@ -126,7 +126,7 @@ def set_up_api(
 
     create_availability_alert_rule(app_insights.id, api_resource_group, action_group_id)
 
-    vault = create_vault(f"{IDENTIFIER}-vlt", api_resource_group)
+    vault = create_vault(f"{get_identifier()}-vlt", api_resource_group)
 
     db_server, db_admin_password = create_database_server(
         "rctab-database-",
@@ -138,7 +138,7 @@ def set_up_api(
     )
 
     database = dbforpostgresql.Database(
-        f"{DATABASE_NAME}-{IDENTIFIER}-",
+        f"{DATABASE_NAME}-{get_identifier()}-",
         dbforpostgresql.DatabaseArgs(
             database_name=DATABASE_NAME,
             resource_group_name=api_resource_group.name,
@@ -180,4 +180,4 @@ def set_up_api(
         controller_key=controller_key,
     )
 
-    return app_plan.id, webapp.default_host_name.apply(lambda x: f"https://{x}")
+    return app_plan.id, Output.concat("https://", webapp.default_host_name)
@@ -11,13 +11,10 @@ Attributes:
         times out. Defaults to "90".
     DATABASE_NAME (str): The name of the database to create. Defaults to "RCTab".
     APP_MODULE (str): The name of the FastAPI app. Defaults to "rctab:app".
-    STACK_NAME (str): The name of the pulumi stack. Set automatically.
     RCTAB_APP_USER (str): The name of the user to create for the RCTab app.
         Defaults to "rctab-api-user".
     ORGANISATION (str): Your organisation's name. REQUIRED.
     TICKER (str): A short form of your organisation's name. REQUIRED.
-    IDENTIFIER (str): The identifier of the organisation. This is the combination
-        of the ticker and stack name. Set automatically.
     RCTAB_TAG (str): The tag of the RCTab Docker image to use. Defaults to "1.latest".
     AUTO_DEPLOY (str): Whether to automatically pull new images. Defaults to "true".
     DOCKER_REGISTRY_SERVER_URL (str): The URL of the Docker registry server.
@@ -56,6 +53,8 @@ Attributes:
     ROLES_FILTER (str): The roles to filter. Defaults to an empty string.
     ADMIN_EMAIL_RECIPIENTS (str): The email recipients for admin emails.
         Defaults to an empty string.
+    ADMIN_EMAIL_RECIPIENTS_LIST (list): ADMIN_EMAIL_RECIPIENTS as a list of
+        email addresses. Set automatically.
     IGNORE_WHITELIST (str): Whether to ignore the whitelist. Defaults to an
         empty string.
     WHITELIST (str): The subscription UUID whitelist. Defaults to an empty string.
@@ -64,13 +63,14 @@ Attributes:
     MGMT_GROUP (str): The management group. REQUIRED.
 """
 
-from typing import Final, Optional
+import json
+from functools import lru_cache
+from typing import Final, List, Optional
 
 from pulumi import Config, Output, get_stack
 from pulumi_azure_native.web import NameValuePairArgs
 
 from rctab_infrastructure.utils import (
-    assert_is_file,
     assert_str_true_or_false,
     assert_valid_int_list,
     assert_valid_log_level,
@@ -78,7 +78,7 @@ from rctab_infrastructure.utils import (
     check_valid_ip_address,
     format_list_int,
     format_list_str,
-    format_secret_list_str,
+    format_secret_as_list,
     raise_billing_or_mgmt,
     validate_ticker_stack_combination,
 )
@@ -89,13 +89,26 @@ config = Config()
 SESSION_TIMEOUT_MINUTES: Final[str] = "90"
 DATABASE_NAME: Final[str] = "RCTab"
 APP_MODULE: Final[str] = "rctab:app"
-STACK_NAME: Final[str] = f"{get_stack()}"
 RCTAB_APP_USER: Final[str] = "rctab-api-user"
 
 # Organisation name
 ORGANISATION: Final[str] = config.require("organisation")
 TICKER: Final[str] = config.require("ticker")
-IDENTIFIER: Final[str] = validate_ticker_stack_combination(TICKER, STACK_NAME)
+
+
+@lru_cache(maxsize=1)
+def get_identifier() -> str:
+    """Get the identifier of the organisation.
+
+    This is the combination of the ticker and the Pulumi stack name. It is only
+    worked out when first needed, so that importing this module doesn't require
+    a Pulumi stack.
+
+    Returns:
+        The identifier, such as "tkr-stack".
+    """
+    return validate_ticker_stack_combination(TICKER, get_stack())
+
 
 # Default image tag for latest major version
 RCTAB_TAG: Final[str] = config.get("rctab_tag") or "1.latest"
@@ -150,9 +163,14 @@ EXPIRY_EMAIL_FREQ: Final[Optional[str]] = format_list_int(
 )
 NOTIFIABLE_ROLES: Final[Optional[str]] = format_list_str(config.get("notifiable_roles"))
 ROLES_FILTER: Final[Optional[str]] = format_list_str(config.get("roles_filter"))
-ADMIN_EMAIL_RECIPIENTS: Final[Optional[Output[str]]] = format_secret_list_str(
+ADMIN_EMAIL_RECIPIENTS_LIST: Final[Optional[Output[List[str]]]] = format_secret_as_list(
     config.get_secret("admin_email_recipients")
 )
+ADMIN_EMAIL_RECIPIENTS: Final[Optional[Output[str]]] = (
+    ADMIN_EMAIL_RECIPIENTS_LIST.apply(json.dumps)
+    if ADMIN_EMAIL_RECIPIENTS_LIST
+    else None
+)
 IGNORE_WHITELIST: Final[Optional[str]] = assert_str_true_or_false(
     config.get("ignore_whitelist")
 )
@@ -170,8 +188,16 @@ MGMT_GROUP: Final[Output[str]] = config.get_secret("usage_mgmt_group") or Output
     ""
 )
 
-BILLING_OR_MGMT: Final[Output[NameValuePairArgs]] = Output.all(
-    billing=BILLING_ACCOUNT_ID, mgmt=MGMT_GROUP
-).apply(raise_billing_or_mgmt)
 
-assert_is_file(DB_ROOT_CERT_PATH)
+@lru_cache(maxsize=1)
+def get_billing_or_mgmt() -> Output[NameValuePairArgs]:
+    """Get the app setting for whichever of BILLING_ACCOUNT_ID or MGMT_GROUP is set.
+
+    This is only built when first needed, rather than when the module is imported.
+
+    Returns:
+        A NameValuePairArgs for either BILLING_ACCOUNT_ID or MGMT_GROUP.
+    """
+    return Output.all(billing=BILLING_ACCOUNT_ID, mgmt=MGMT_GROUP).apply(
+        raise_billing_or_mgmt
+    )
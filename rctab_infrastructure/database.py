@@ -6,16 +6,16 @@ import pulumi
 import pulumi_azure_native.dbforpostgresql.v20230301preview as dbforpostgresql
 import pulumi_random as random
 from pulumi import ResourceOptions
-from pulumi_azure_native import authorization, keyvault, resources
+from pulumi_azure_native import keyvault, resources
 from pulumi_postgresql import Grant, GrantArgs, Provider, ProviderArgs, Role, RoleArgs
 
 from rctab_infrastructure.constants import (
     AD_SERVER_ADMIN,
     DB_ROOT_CERT_PATH,
-    IDENTIFIER,
     RCTAB_APP_USER,
+    get_identifier,
 )
-from rctab_infrastructure.utils import raise_if_none
+from rctab_infrastructure.utils import get_client_config, raise_if_none
 
 SERVER_VERSION: Final[dbforpostgresql.ServerVersion] = (
     dbforpostgresql.ServerVersion.SERVER_VERSION_14
@@ -48,7 +48,7 @@ def create_database_server(
     Returns:
         A tuple containing the database server and the admin password.
     """
-    context = authorization.get_client_config()
+    context = get_client_config()
 
     # Create admin Credentials and place in keyvault
     admin_password = random.RandomPassword(
@@ -73,7 +73,7 @@ def create_database_server(
     )
 
     # Add Database Server
-    server_name = f"{IDENTIFIER}-rctab-".lower()
+    server_name = f"{get_identifier()}-rctab-".lower()
     # Add random string to end of server name to prevent ServerGroupDropping
     # error on rebuild
     random_code = random.RandomString(
@@ -81,7 +81,7 @@ def create_database_server(
     )
     server_name_with_random_code = pulumi.Output.concat(server_name, random_code.result)
     server = dbforpostgresql.Server(
-        f"{name}{IDENTIFIER}-",
+        f"{name}{get_identifier()}-",
         dbforpostgresql.ServerArgs(
             resource_group_name=resource_group.name,
             location=resource_group.location,
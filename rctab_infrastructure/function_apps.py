@@ -20,18 +20,42 @@ from rctab_infrastructure.constants import (
     AD_STATUS_CLIENT_SECRET,
     AD_TENANT_ID,
     AUTO_DEPLOY,
-    BILLING_OR_MGMT,
     DOCKER_CONTROLLER_IMAGE,
     DOCKER_REGISTRY_SERVER_PASSWORD,
     DOCKER_REGISTRY_SERVER_URL,
     DOCKER_REGISTRY_SERVER_USERNAME,
     DOCKER_STATUS_IMAGE,
     DOCKER_USAGE_IMAGE,
-    IDENTIFIER,
+    get_billing_or_mgmt,
+    get_identifier,
 )
 
 # pylint: disable=too-many-arguments
 
+# Identifiers are ASCII so this drops everything but letters from them
+_DELETE_NON_ALPHA = str.maketrans(
+    {chr(c): None for c in range(128) if not chr(c).isalpha()}
+)
+
+# App settings that are the same for every function app
+_STATIC_APP_SETTINGS: Tuple[web.NameValuePairArgs, ...] = (
+    web.NameValuePairArgs(name="WEBSITES_ENABLE_APP_SERVICE_STORAGE", value="false"),
+    web.NameValuePairArgs(
+        name="DOCKER_REGISTRY_SERVER_URL",
+        value=DOCKER_REGISTRY_SERVER_URL,
+    ),
+    web.NameValuePairArgs(
+        name="DOCKER_REGISTRY_SERVER_USERNAME",
+        value=DOCKER_REGISTRY_SERVER_USERNAME,
+    ),
+    web.NameValuePairArgs(
+        name="DOCKER_REGISTRY_SERVER_PASSWORD",
+        value=DOCKER_REGISTRY_SERVER_PASSWORD,
+    ),
+    web.NameValuePairArgs(name="WEBSITES_PORT", value="80"),
+    web.NameValuePairArgs(name="DOCKER_ENABLE_CI", value=AUTO_DEPLOY),
+)
+
 
 def create_alert_rule(
     first_letter: str,
@@ -127,7 +151,7 @@ def create_function_app(
     first_letter = image_name.split("/")[-1].split("-")[-1][0]
 
     app_insights = Component(
-        f"{first_letter}-function-{IDENTIFIER}-",
+        f"{first_letter}-function-{get_identifier()}-",
         ComponentArgs(
             resource_group_name=resource_group.name,
             location=resource_group.location,
@@ -139,7 +163,7 @@ def create_function_app(
     )
 
     function_app = web.WebApp(
-        f"{first_letter}-function-{IDENTIFIER}-",
+        f"{first_letter}-function-{get_identifier()}-",
         web.WebAppArgs(
             identity=web.ManagedServiceIdentityArgs(type=identity_type),
             resource_group_name=resource_group.name,
@@ -147,24 +171,8 @@ def create_function_app(
             kind="functionapp",
             server_farm_id=app_plan_id,
             site_config=web.SiteConfigArgs(
-                app_settings=(
-                    web.NameValuePairArgs(
-                        name="WEBSITES_ENABLE_APP_SERVICE_STORAGE", value="false"
-                    ),
-                    web.NameValuePairArgs(
-                        name="DOCKER_REGISTRY_SERVER_URL",
-                        value=DOCKER_REGISTRY_SERVER_URL,
-                    ),
-                    web.NameValuePairArgs(
-                        name="DOCKER_REGISTRY_SERVER_USERNAME",
-                        value=DOCKER_REGISTRY_SERVER_USERNAME,
-                    ),
-                    web.NameValuePairArgs(
-                        name="DOCKER_REGISTRY_SERVER_PASSWORD",
-                        value=DOCKER_REGISTRY_SERVER_PASSWORD,
-                    ),
-                    web.NameValuePairArgs(name="WEBSITES_PORT", value="80"),
-                    web.NameValuePairArgs(name="DOCKER_ENABLE_CI", value=AUTO_DEPLOY),
+                app_settings=_STATIC_APP_SETTINGS
+                + (
                     web.NameValuePairArgs(
                         name="CENTRAL_LOGGING_CONNECTION_STRING",
                         value=logging_connection_string,
@@ -198,9 +206,7 @@ def create_function_app(
 
     pulumi.export(
         f"getStartedEndpoint-{image_name}",
-        function_app.default_host_name.apply(
-            lambda default_host_name: f"https://{default_host_name}"
-        ),
+        Output.concat("https://", function_app.default_host_name),
     )
 
 
@@ -230,14 +236,14 @@ def set_up_function_apps(
         None.
     """
     resource_group = resources.ResourceGroup(
-        f"rctab-mngmnt-functions-{IDENTIFIER}-",
+        f"rctab-mngmnt-functions-{get_identifier()}-",
         resources.ResourceGroupArgs(
             location="UK South",
         ),
     )
 
     account = storage.StorageAccount(
-        "store" + "".join(char for char in IDENTIFIER if char.isalpha()).lower(),
+        "store" + get_identifier().translate(_DELETE_NON_ALPHA).lower(),
         storage.StorageAccountArgs(
             resource_group_name=resource_group.name,
             location=resource_group.location,
@@ -246,15 +252,9 @@ def set_up_function_apps(
         ),
     )
 
-    primary_key = (
-        pulumi.Output.all(resource_group.name, account.name)
-        .apply(
-            lambda args: storage.list_storage_account_keys(
-                resource_group_name=args[0], account_name=args[1]
-            )
-        )
-        .apply(lambda account_keys: account_keys.keys[0].value)
-    )
+    primary_key = storage.list_storage_account_keys_output(
+        resource_group_name=resource_group.name, account_name=account.name
+    ).apply(lambda account_keys: account_keys.keys[0].value)
 
     connection_string = Output.concat(
         "DefaultEndpointsProtocol=https;AccountName=",
@@ -264,19 +264,12 @@ def set_up_function_apps(
         ";EndpointSuffix=core.windows.net",
     )
 
-    for image_name, app_settings, identity_type in zip(
+    for image_name, private_key, extra_settings, identity_type in zip(
         [DOCKER_USAGE_IMAGE, DOCKER_STATUS_IMAGE, DOCKER_CONTROLLER_IMAGE],
+        [usage_key, status_key, controller_key],
         [
+            (get_billing_or_mgmt(),),
             (
-                web.NameValuePairArgs(
-                    name="PRIVATE_KEY", value=usage_key.private_key_openssh
-                ),
-                BILLING_OR_MGMT,
-            ),
-            (
-                web.NameValuePairArgs(
-                    name="PRIVATE_KEY", value=status_key.private_key_openssh
-                ),
                 web.NameValuePairArgs(name="AZURE_TENANT_ID", value=AD_TENANT_ID),
                 web.NameValuePairArgs(
                     name="AZURE_CLIENT_ID", value=AD_STATUS_CLIENT_ID
@@ -285,11 +278,7 @@ def set_up_function_apps(
                     name="AZURE_CLIENT_SECRET", value=AD_STATUS_CLIENT_SECRET
                 ),
             ),
-            (
-                web.NameValuePairArgs(
-                    name="PRIVATE_KEY", value=controller_key.private_key_openssh
-                ),
-            ),
+            (),
         ],
         [
             web.ManagedServiceIdentityType.SYSTEM_ASSIGNED,
@@ -297,6 +286,12 @@ def set_up_function_apps(
             web.ManagedServiceIdentityType.SYSTEM_ASSIGNED,
         ],
     ):
+        # Every function app signs its requests to the API with its own key
+        app_settings = (
+            web.NameValuePairArgs(
+                name="PRIVATE_KEY", value=private_key.private_key_openssh
+            ),
+        ) + extra_settings
         create_function_app(
             resource_group,
             app_plan_id,
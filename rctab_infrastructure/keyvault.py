@@ -1,8 +1,58 @@
 """Key vault infrastructure code."""
 
-from pulumi_azure_native import authorization, keyvault, resources
+from typing import Tuple
+
+from pulumi_azure_native import keyvault, resources
 from pulumi_azure_native.keyvault import SkuName
 
+from rctab_infrastructure.utils import get_client_config
+
+# Permissions given to the deploying client on the vault
+_CERTIFICATE_PERMISSIONS: Tuple[str, ...] = (
+    "get",
+    "list",
+    "delete",
+    "create",
+    "import",
+    "update",
+    "managecontacts",
+    "getissuers",
+    "listissuers",
+    "setissuers",
+    "deleteissuers",
+    "manageissuers",
+    "recover",
+    "purge",
+)
+_KEY_PERMISSIONS: Tuple[str, ...] = (
+    "encrypt",
+    "decrypt",
+    "wrapKey",
+    "unwrapKey",
+    "sign",
+    "verify",
+    "get",
+    "list",
+    "create",
+    "update",
+    "import",
+    "delete",
+    "backup",
+    "restore",
+    "recover",
+    "purge",
+)
+_SECRET_PERMISSIONS: Tuple[str, ...] = (
+    "get",
+    "list",
+    "set",
+    "delete",
+    "backup",
+    "restore",
+    "recover",
+    "purge",
+)
+
 
 def create_vault(name: str, resource_group: resources.ResourceGroup) -> keyvault.Vault:
     """Create a keyvault in a resource group.
@@ -14,7 +64,7 @@ def create_vault(name: str, resource_group: resources.ResourceGroup) -> keyvault
     Returns:
         The keyvault.
     """
-    context = authorization.get_client_config()
+    context = get_client_config()
     return keyvault.Vault(
         name,
         keyvault.VaultArgs(
@@ -33,50 +83,9 @@ def create_vault(name: str, resource_group: resources.ResourceGroup) -> keyvault
                     keyvault.AccessPolicyEntryArgs(
                         object_id=context.object_id,
                         permissions=keyvault.PermissionsArgs(
-                            certificates=[
-                                "get",
-                                "list",
-                                "delete",
-                                "create",
-                                "import",
-                                "update",
-                                "managecontacts",
-                                "getissuers",
-                                "listissuers",
-                                "setissuers",
-                                "deleteissuers",
-                                "manageissuers",
-                                "recover",
-                                "purge",
-                            ],
-                            keys=[
-                                "encrypt",
-                                "decrypt",
-                                "wrapKey",
-                                "unwrapKey",
-                                "sign",
-                                "verify",
-                                "get",
-                                "list",
-                                "create",
-                                "update",
-                                "import",
-                                "delete",
-                                "backup",
-                                "restore",
-                                "recover",
-                                "purge",
-                            ],
-                            secrets=[
-                                "get",
-                                "list",
-                                "set",
-                                "delete",
-                                "backup",
-                                "restore",
-                                "recover",
-                                "purge",
-                            ],
+                            certificates=_CERTIFICATE_PERMISSIONS,
+                            keys=_KEY_PERMISSIONS,
+                            secrets=_SECRET_PERMISSIONS,
                         ),
                         tenant_id=context.tenant_id,
                     )
@@ -11,7 +11,7 @@ from pulumi_azure_native.insights import (
 )
 from pulumi_azure_native.insights.v20200202 import Component
 
-from rctab_infrastructure.constants import ADMIN_EMAIL_RECIPIENTS, IDENTIFIER
+from rctab_infrastructure.constants import ADMIN_EMAIL_RECIPIENTS_LIST, get_identifier
 
 
 def set_up_logging() -> Tuple[Output[str], Output[str], resources.ResourceGroup]:
@@ -25,12 +25,12 @@ def set_up_logging() -> Tuple[Output[str], Output[str], resources.ResourceGroup]
         connection string and the resource group.
     """
     logging_resource_group = resources.ResourceGroup(
-        f"rctab-central-logging-{IDENTIFIER}-",
+        f"rctab-central-logging-{get_identifier()}-",
         location="UK South",
     )
 
     workspace = operationalinsights.Workspace(
-        f"rctab-workspace-{IDENTIFIER}-",
+        f"rctab-workspace-{get_identifier()}-",
         location=logging_resource_group.location,
         resource_group_name=logging_resource_group.name,
         sku=operationalinsights.WorkspaceSkuArgs(
@@ -39,7 +39,7 @@ def set_up_logging() -> Tuple[Output[str], Output[str], resources.ResourceGroup]
     )
 
     logging_app_insights = Component(
-        f"rctab-logging-{IDENTIFIER}-",
+        f"rctab-logging-{get_identifier()}-",
         resource_group_name=logging_resource_group.name,
         location=logging_resource_group.location,
         application_type="functionapp",
@@ -64,15 +64,15 @@ def create_action_group(logging_resource_group_name: Output[str]) -> Output[str]
     """
     email_receivers: Optional[Output[Sequence[EmailReceiverArgs]]]
 
-    if ADMIN_EMAIL_RECIPIENTS is not None:
-        email_receivers = ADMIN_EMAIL_RECIPIENTS.apply(
-            lambda x: [
+    if ADMIN_EMAIL_RECIPIENTS_LIST is not None:
+        email_receivers = ADMIN_EMAIL_RECIPIENTS_LIST.apply(
+            lambda emails: [
                 EmailReceiverArgs(
-                    email_address=split_x.strip(),
-                    name=split_x.split("@")[0].strip(),
+                    email_address=email,
+                    name=email.split("@")[0],
                     use_common_alert_schema=False,
                 )
-                for split_x in x.translate(str.maketrans("", "", '[]"')).split(",")
+                for email in emails
             ]
         )
     else:
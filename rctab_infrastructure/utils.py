@@ -1,16 +1,43 @@
 """General infrastructure code utilities."""
 
 import ipaddress
+import json
+import os
 import re
-import uuid
-from pathlib import Path
-from typing import Any, Dict, Optional, TypeVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypeVar, cast
 
 from pulumi import Output
-from pulumi_azure_native.web import NameValuePairArgs
+
+if TYPE_CHECKING:
+    # pulumi_azure_native's modules are slow to import so only do so when needed
+    from pulumi_azure_native.authorization import GetClientConfigResult
+    from pulumi_azure_native.web import NameValuePairArgs
 
 T = TypeVar("T")
 
+_VALID_IDENTIFIER_PATTERN = r"^[a-zA-Z0-9-]{3,20}$"
+_VALID_IDENTIFIER_RE = re.compile(_VALID_IDENTIFIER_PATTERN)
+_UUID_PATTERN = (
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+_UUID_RE = re.compile(_UUID_PATTERN)
+_UUID_LIST_RE = re.compile(rf"\s*{_UUID_PATTERN}(?:\s*,\s*{_UUID_PATTERN})*\s*")
+
+# Ordered for error messages, with a set for lookups
+_LOG_LEVELS = (
+    "CRITICAL",
+    "FATAL",
+    "ERROR",
+    "WARNING",
+    "WARN",
+    "INFO",
+    "DEBUG",
+    "NOTSET",
+)
+_ALLOWED_LOG_LEVELS = frozenset(_LOG_LEVELS)
+_TRUE_OR_FALSE = frozenset(("true", "false"))
+
 
 def format_list_str(input_str: Optional[str]) -> Optional[str]:
     """Convert a comma-separated list of strings into a JSON compatible list.
@@ -20,15 +47,34 @@ def format_list_str(input_str: Optional[str]) -> Optional[str]:
 
     Returns:
         A JSON compatible list string such as '["abc", "def", "ghi"]'.
+        Strings that are already JSON lists of strings, such as '["abc"]',
+        are returned as is.
     """
-    if input_str:
-        formatted_str = ", ".join(
-            [f'"{item.strip()}"' for item in input_str.split(",")]
-        )
-        return f"[{formatted_str}]"
+    if input_str and not _is_json_str_list(input_str):
+        return json.dumps([item.strip() for item in input_str.split(",")])
     return input_str
 
 
+def _is_json_str_list(input_str: str) -> bool:
+    """Check whether a string is a JSON list of strings.
+
+    Args:
+        input_str: The string to check.
+
+    Returns:
+        True if input_str parses as a JSON list of strings. False otherwise.
+    """
+    if not input_str.startswith("["):
+        return False
+    try:
+        parsed = json.loads(input_str)
+    except ValueError:
+        return False
+    if not isinstance(parsed, list):
+        return False
+    return all(isinstance(item, str) for item in cast(List[Any], parsed))
+
+
 def format_list_int(input_str: Optional[str]) -> Optional[str]:
     """Convert a comma-separated list of ints into a JSON compatible list.
 
@@ -52,13 +98,25 @@ def format_secret_list_str(input_str: Optional[Output[str]]) -> Optional[Output[
     Returns:
         A JSON compatible secret list string such as '["abc", "def", "ghi"]'.
     """
+    formatted_list = format_secret_as_list(input_str)
+    if formatted_list:
+        return formatted_list.apply(json.dumps)
+    return formatted_list
+
+
+def format_secret_as_list(
+    input_str: Optional[Output[str]],
+) -> Optional[Output[List[str]]]:
+    """Convert a comma-separated list into a list of strings.
+
+    Args:
+        input_str: A comma separated list such as 'abc, def, ghi', wrapped in an Output.
+
+    Returns:
+        A secret list such as ["abc", "def", "ghi"].
+    """
     if input_str:
-        formatted_str = input_str.apply(
-            lambda x: "["
-            + ", ".join([f'"{item.strip()}"' for item in x.split(",")])
-            + "]"
-        )
-        return formatted_str
+        return input_str.apply(lambda x: [item.strip() for item in x.split(",")])
     return input_str
 
 
@@ -91,7 +149,7 @@ def assert_is_file(filepath: str) -> str:
     Returns:
         The filepath if it is a valid path to a real file.
     """
-    assert Path(filepath).is_file()
+    assert os.path.isfile(filepath), f"{filepath} is not a file"
     return filepath
 
 
@@ -108,9 +166,8 @@ def assert_str_true_or_false(checkstr: Optional[str]) -> Optional[str]:
         checkstr if the value is 'true' or 'false'.
     """
     if checkstr:
-        assert checkstr in (
-            "true",
-            "false",
+        assert (
+            checkstr in _TRUE_OR_FALSE
         ), f"{checkstr} is an invalid value. Allowed values are 'true' or 'false'."
     return checkstr
 
@@ -134,20 +191,19 @@ def validate_ticker_stack_combination(ticker: str, stack: str) -> str:
     Returns:
         The proposed identifier for the stack.
     """
-    valid_identifier_pattern = r"^[a-zA-Z0-9-]{3,20}$"
     proposed_identifier = f"{ticker}-{stack}"
     org_stack = f"{proposed_identifier}-abcdefgh"
     # check ticker and stack name together is valid
     assert len(ticker) > 1, "Ticker cannot be less than 2 characters"
     assert len(ticker) < 7, "Ticker cannot be more than 6 characters"
-    assert re.match(valid_identifier_pattern, org_stack), (
+    assert _VALID_IDENTIFIER_RE.match(org_stack), (
         f"The organisation and stack name must match the pattern "
-        f"'{valid_identifier_pattern}' but is '{org_stack}'."
+        f"'{_VALID_IDENTIFIER_PATTERN}' but is '{org_stack}'."
     )
     return proposed_identifier
 
 
-def raise_billing_or_mgmt(kwargs: Dict[str, Any]) -> NameValuePairArgs:
+def raise_billing_or_mgmt(kwargs: Dict[str, Any]) -> "NameValuePairArgs":
     """Raise if both billing and mngmt are set or neither are set.
 
     Args:
@@ -159,6 +215,9 @@ def raise_billing_or_mgmt(kwargs: Dict[str, Any]) -> NameValuePairArgs:
     Returns:
         A NameValuePairArgs object with either BILLING_ACCOUNT_ID or MGMT_GROUP set.
     """
+    # pylint: disable=import-outside-toplevel
+    from pulumi_azure_native.web import NameValuePairArgs
+
     billing = kwargs["billing"]
     mgmt = kwargs["mgmt"]
     if billing and mgmt:
@@ -179,17 +238,15 @@ def raise_billing_or_mgmt(kwargs: Dict[str, Any]) -> NameValuePairArgs:
 def is_valid_uuid(check_uuid: str) -> bool:
     """Check a provided UUID is a valid UUID.
 
+    Only the canonical, hyphenated form (8-4-4-4-12 hex digits) is accepted.
+
     Args:
         check_uuid: The UUID to check.
 
     Returns:
         True if check_uuid is a valid UUID. False otherwise.
     """
-    try:
-        uuid.UUID(check_uuid)
-        return True
-    except ValueError:
-        return False
+    return _UUID_RE.fullmatch(check_uuid) is not None
 
 
 def assert_valid_uuid_list(whitelist: Optional[str]) -> Optional[str]:
@@ -205,14 +262,32 @@ def assert_valid_uuid_list(whitelist: Optional[str]) -> Optional[str]:
         The whitelist if it is a list of valid UUIDs or an empty string.
     """
     if whitelist:
-        uuids = whitelist.split(",")
-        for item in uuids:
-            assert (
-                is_valid_uuid(item.strip()) is True
-            ), f"{item.strip()} is not a valid UUID"
+        # The message is only built, by walking the items, if the match fails
+        assert (
+            _UUID_LIST_RE.fullmatch(whitelist) is not None
+        ), f"{_first_invalid_uuid(whitelist)} is not a valid UUID"
     return whitelist
 
 
+def _first_invalid_uuid(whitelist: str) -> Optional[str]:
+    """Find the first item in a comma separated list that is not a valid UUID.
+
+    Args:
+        whitelist: A comma separated list of UUIDs.
+
+    Returns:
+        The first invalid item, stripped of whitespace, or None if all are valid.
+    """
+    return next(
+        (
+            item
+            for item in (raw.strip() for raw in whitelist.split(","))
+            if not is_valid_uuid(item)
+        ),
+        None,
+    )
+
+
 def assert_valid_log_level(log_level: Optional[str]) -> Optional[str]:
     """Check the log level is a valid log level.
 
@@ -230,21 +305,11 @@ def assert_valid_log_level(log_level: Optional[str]) -> Optional[str]:
     """
     if log_level:
         log_level = log_level.upper()
-        allowed_levels = (
-            "CRITICAL",
-            "FATAL",
-            "ERROR",
-            "WARNING",
-            "WARN",
-            "INFO",
-            "DEBUG",
-            "NOTSET",
-        )
-        assert log_level in allowed_levels, f"{log_level} not in {allowed_levels}"
+        assert log_level in _ALLOWED_LOG_LEVELS, f"{log_level} not in {_LOG_LEVELS}"
     return log_level
 
 
-def check_valid_ip_address(ip2check: str):
+def check_valid_ip_address(ip2check: str) -> str:
     """Check an IP address is a valid IP address.
 
     Args:
@@ -270,9 +335,28 @@ def assert_valid_int_list(int_list: Optional[str]) -> Optional[str]:
         The int_list if it is a list of valid integers or an empty string.
     """
     if int_list:
-        integers = int_list.split(",")
-        for item in integers:
-            assert (
-                item.strip().isdecimal() is True
-            ), f"{item.strip()} is not a valid integer."
+        invalid = next(
+            (
+                item
+                for item in (raw.strip() for raw in int_list.split(","))
+                if not item.isdecimal()
+            ),
+            None,
+        )
+        assert invalid is None, f"{invalid} is not a valid integer."
     return int_list
+
+
+@lru_cache(maxsize=1)
+def get_client_config() -> "GetClientConfigResult":
+    """Get the configuration of the client that Pulumi is running as.
+
+    The result is cached so that the invoke only runs once per program.
+
+    Returns:
+        The tenant, object and subscription ids of the current client.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pulumi_azure_native.authorization import get_client_config as get_config
+
+    return get_config()
@@ -18,7 +18,6 @@ from rctab_infrastructure.constants import (
     DOCKER_REGISTRY_SERVER_URL,
     DOCKER_REGISTRY_SERVER_USERNAME,
     EXPIRY_EMAIL_FREQ,
-    IDENTIFIER,
     IGNORE_WHITELIST,
     LOG_LEVEL,
     NOTIFIABLE_ROLES,
@@ -29,6 +28,7 @@ from rctab_infrastructure.constants import (
     SENDGRID_SENDER_EMAIL,
     SESSION_TIMEOUT_MINUTES,
     WHITELIST,
+    get_identifier,
 )
 from rctab_infrastructure.utils import raise_if_none
 
@@ -67,13 +67,38 @@ def create_webapp(
     Returns:
         The webapp.
     """
-    active_directory_args = [
+    session_cookie_secret = random.RandomPassword(
+        "session_cookie_secret",
+        random.RandomPasswordArgs(
+            length=25,
+            special=True,
+            override_special="_%@",
+        ),
+        opts=ResourceOptions(additional_secret_outputs=["result"]),
+    )
+
+    keyvault.Secret(
+        "session_cookie_secret",
+        keyvault.SecretArgs(
+            properties=keyvault.SecretPropertiesArgs(
+                value=session_cookie_secret.result,
+            ),
+            resource_group_name=resource_group.name,
+            secret_name="session-cookie-secret",
+            vault_name=vault.name,
+        ),
+    )
+
+    fully_qualified_domain_name = database_server.fully_qualified_domain_name.apply(
+        raise_if_none
+    )
+
+    app_settings = [
+        # Active Directory
         web.NameValuePairArgs(name="TENANT_ID", value=AD_TENANT_ID),
         web.NameValuePairArgs(name="CLIENT_ID", value=AD_API_CLIENT_ID),
         web.NameValuePairArgs(name="CLIENT_SECRET", value=AD_API_CLIENT_SECRET),
-    ]
-
-    web_args = [
+        # Web
         web.NameValuePairArgs(
             name="WEBSITES_ENABLE_APP_SERVICE_STORAGE", value="false"
         ),
@@ -102,60 +127,7 @@ def create_webapp(
             value=app_insights_connection_string,
         ),
         web.NameValuePairArgs(name="ORGANISATION", value=ORGANISATION),
-    ]
-
-    fully_qualified_domain_name = database_server.fully_qualified_domain_name.apply(
-        raise_if_none
-    )
-    database_connection_args = [
-        web.NameValuePairArgs(name="APP_MODULE", value=APP_MODULE),
-        web.NameValuePairArgs(name="TIMEOUT", value="300"),
-        web.NameValuePairArgs(name="DB_HOST", value=fully_qualified_domain_name),
-        web.NameValuePairArgs(name="DB_NAME", value=database.name),
-        web.NameValuePairArgs(name="DB_USER", value=RCTAB_APP_USER),
-        web.NameValuePairArgs(name="DB_PASSWORD", value=database_user_password.result),
-        web.NameValuePairArgs(name="SSL_REQUIRED", value="true"),
-    ]
-
-    additional_settings = [
-        web.NameValuePairArgs(name=item[0], value=item[1])
-        for item in (
-            ["SENDGRID_API_KEY", SENDGRID_API_KEY],
-            ["SENDGRID_SENDER_EMAIL", SENDGRID_SENDER_EMAIL],
-            ["EXPIRY_EMAIL_FREQ", EXPIRY_EMAIL_FREQ],
-            ["NOTIFIABLE_ROLES", NOTIFIABLE_ROLES],
-            ["ROLES_FILTER", ROLES_FILTER],
-            ["ADMIN_EMAIL_RECIPIENTS", ADMIN_EMAIL_RECIPIENTS],
-            ["IGNORE_WHITELIST", IGNORE_WHITELIST],
-            ["WHITELIST", WHITELIST],
-            ["LOG_LEVEL", LOG_LEVEL],
-        )
-        if item[1]
-    ]
-
-    session_cookie_secret = random.RandomPassword(
-        "session_cookie_secret",
-        random.RandomPasswordArgs(
-            length=25,
-            special=True,
-            override_special="_%@",
-        ),
-        opts=ResourceOptions(additional_secret_outputs=["result"]),
-    )
-
-    keyvault.Secret(
-        "session_cookie_secret",
-        keyvault.SecretArgs(
-            properties=keyvault.SecretPropertiesArgs(
-                value=session_cookie_secret.result,
-            ),
-            resource_group_name=resource_group.name,
-            secret_name="session-cookie-secret",
-            vault_name=vault.name,
-        ),
-    )
-
-    session_cookie_args = [
+        # Session cookie
         web.NameValuePairArgs(
             name="SESSION_EXPIRE_TIME_MINUTES", value=SESSION_TIMEOUT_MINUTES
         ),
@@ -163,9 +135,15 @@ def create_webapp(
             name="SESSION_SECRET",
             value=session_cookie_secret.result,
         ),
-    ]
-
-    public_key_args = [
+        # Database connection
+        web.NameValuePairArgs(name="APP_MODULE", value=APP_MODULE),
+        web.NameValuePairArgs(name="TIMEOUT", value="300"),
+        web.NameValuePairArgs(name="DB_HOST", value=fully_qualified_domain_name),
+        web.NameValuePairArgs(name="DB_NAME", value=database.name),
+        web.NameValuePairArgs(name="DB_USER", value=RCTAB_APP_USER),
+        web.NameValuePairArgs(name="DB_PASSWORD", value=database_user_password.result),
+        web.NameValuePairArgs(name="SSL_REQUIRED", value="true"),
+        # Function app public keys
         web.NameValuePairArgs(
             name="USAGE_FUNC_PUBLIC_KEY",
             value=usage_key.public_key_openssh,
@@ -180,20 +158,27 @@ def create_webapp(
         ),
     ]
 
-    # Concat all settings
-    app_settings = (
-        active_directory_args
-        + web_args
-        + session_cookie_args
-        + database_connection_args
-        + public_key_args
-        + additional_settings
+    # Optional settings are only added if they have a value
+    app_settings.extend(
+        web.NameValuePairArgs(name=name, value=value)
+        for name, value in (
+            ("SENDGRID_API_KEY", SENDGRID_API_KEY),
+            ("SENDGRID_SENDER_EMAIL", SENDGRID_SENDER_EMAIL),
+            ("EXPIRY_EMAIL_FREQ", EXPIRY_EMAIL_FREQ),
+            ("NOTIFIABLE_ROLES", NOTIFIABLE_ROLES),
+            ("ROLES_FILTER", ROLES_FILTER),
+            ("ADMIN_EMAIL_RECIPIENTS", ADMIN_EMAIL_RECIPIENTS),
+            ("IGNORE_WHITELIST", IGNORE_WHITELIST),
+            ("WHITELIST", WHITELIST),
+            ("LOG_LEVEL", LOG_LEVEL),
+        )
+        if value
     )
 
     web_app = web.WebApp(
-        f"rctab-api-{IDENTIFIER}",
+        f"rctab-api-{get_identifier()}",
         web.WebAppArgs(
-            name=f"rctab-{IDENTIFIER}",
+            name=f"rctab-{get_identifier()}",
             resource_group_name=resource_group.name,
             location=resource_group.location,
             server_farm_id=app_plan_id,
@@ -206,7 +191,8 @@ def create_webapp(
         ),
     )
 
-    # Add the webapps outbound ips to the database whitelist
+    # Add the webapps outbound ips to the database whitelist, skipping any
+    # duplicates so that each address gets a single firewall rule
     web_app.possible_outbound_ip_addresses.apply(
         lambda x: [
             dbforpostgresql.FirewallRule(
@@ -219,7 +205,7 @@ def create_webapp(
                     server_name=database_server.name,
                 ),
             )
-            for i, ip in enumerate(x.split(","))
+            for i, ip in enumerate(dict.fromkeys(s.strip() for s in x.split(",")))
         ]
     )
 
@@ -1,5 +1,6 @@
 import unittest
 from pathlib import Path
+from typing import List
 
 import pulumi
 from pulumi import Output
@@ -14,6 +15,7 @@ from rctab_infrastructure.utils import (
     check_valid_ip_address,
     format_list_int,
     format_list_str,
+    format_secret_as_list,
     format_secret_list_str,
     is_valid_uuid,
     raise_billing_or_mgmt,
@@ -27,6 +29,10 @@ class SyncTestCase(unittest.TestCase):
 
     def test_format_list_str(self):
         self.assertEqual('["abc", "def", "ghi"]', format_list_str("abc, def, ghi"))
+        self.assertEqual('["a\\"b", "c"]', format_list_str('a"b, c'))
+        self.assertEqual('["abc", "def"]', format_list_str('["abc", "def"]'))
+        self.assertEqual('["[admin", "owner"]', format_list_str("[admin, owner"))
+        self.assertEqual('["[1", "2]"]', format_list_str("[1, 2]"))
 
     def test_format_list_int(self):
         self.assertEqual("[1, 2]", format_list_int("1, 2"))
@@ -86,6 +92,8 @@ class SyncTestCase(unittest.TestCase):
     def test_is_valid_uuid(self):
         self.assertTrue(is_valid_uuid("00000000-0000-0000-0000-000000000000"))
         self.assertFalse(is_valid_uuid("0000000-0000-0000-0000-000000000000"))
+        self.assertFalse(is_valid_uuid("00000000000000000000000000000000"))
+        self.assertFalse(is_valid_uuid("00000000-0000-0000-0000-000000000000\n"))
 
     def test_assert_valid_uuid_list(self) -> None:
         self.assertIsNone(assert_valid_uuid_list(None))
@@ -100,6 +108,9 @@ class SyncTestCase(unittest.TestCase):
         with self.assertRaises(AssertionError) as cm:
             assert_valid_uuid_list("hi")
         self.assertEqual("hi is not a valid UUID", str(cm.exception))
+        with self.assertRaises(AssertionError) as cm:
+            assert_valid_uuid_list("00000000-0000-0000-0000-000000000000, hi ")
+        self.assertEqual("hi is not a valid UUID", str(cm.exception))
 
     def test_assert_valid_log_level(self):
         allowed_levels = (
@@ -176,3 +187,14 @@ class AsyncTestCase(unittest.TestCase):
         output = format_secret_list_str(Output.secret("abc, def, ghi"))
         assert output is not None
         return output.apply(check_list_str)
+
+    @pulumi.runtime.test  # type: ignore
+    def test_format_secret_as_list(self) -> Output[List[str]]:
+        def check_list(items: List[str]) -> List[str]:
+            self.assertEqual(["abc", "def", "ghi"], items)
+            return items
+
+        self.assertIsNone(format_secret_as_list(None))
+        output = format_secret_as_list(Output.secret("abc, def, ghi"))
+        assert output is not None
+        return output.apply(check_list)